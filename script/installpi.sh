@@ -2,11 +2,12 @@
 # Simple install script
 # FOR RASPBERRY PI VERSION ONLY
 
-cp isspointer2.py /home/pi/isspointer.py
+cp isspointer.py /home/pi/isspointer.py
+cp -rp ./isstrack /home/pi
 cp run.sh /home/pi/run.sh
 cd ..
 cp -rp ./sounds /home/pi
 
+echo "Edit /home/pi/isstrack/config.py for your location and pointer IP"
 echo "Append the following line to /etc/rc.local before the exit 0"
 echo "/bin/sh /home/pi/run.sh"
-
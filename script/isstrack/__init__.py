@@ -0,0 +1,12 @@
+# ISSPointer tracking package
+# https://github.com/rgrokett/ESP8266_ISSPointer
+#
+# config.py        -- USER VARIABLES (edit for your location!)
+# orbit.py         -- TLE download and ISS position/pass prediction
+# tracker.py       -- main tracking loop
+# outputs/         -- pointer, LCD and audio outputs, loaded only if enabled
+#
+#     license: GPLv3, see: www.gnu.org/licenses/gpl-3.0.html
+#
+
+VERSION = "3.0"
@@ -0,0 +1,7 @@
+# python3 -m isstrack [--lcd] [--audio]
+import time
+START = time.time()
+
+from .tracker import main
+
+main(start=START)
@@ -0,0 +1,63 @@
+# LOCAL PASS/POSITION QUERY API
+# Lets dashboards, bots etc. ask this process when the ISS is up instead
+# of each doing their own orbital math. Answers come from the cache.
+#
+#   http://{API_HOST}:{API_PORT}/passes    -- upcoming passes
+#   http://{API_HOST}:{API_PORT}/position  -- current alt/az/sublat/sublong
+#
+
+import datetime
+import http.server
+import json
+import threading
+
+from . import cache
+from . import config
+from . import orbit
+
+
+# JSON FOR datetimes
+def jsonDefault(obj):
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat() + "Z"
+    raise TypeError(repr(obj))
+
+class Handler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        path = self.path.split('?')[0].rstrip('/')
+        if not orbit.glob_tle:
+            return self.reply(503, {"error": "no TLE yet"})
+        try:
+            if (path == "/passes"):
+                body = {"tle_epoch": cache.tleEpoch(), "passes": cache.passes()}
+            elif (path == "/position"):
+                body = dict(cache.position())
+                del body["stamp"]
+            else:
+                return self.reply(404, {"error": "try /passes or /position"})
+        except Exception as ex:
+            return self.reply(500, {"error": str(ex)})
+        self.reply(200, body)
+
+    def reply(self, code, body):
+        data = json.dumps(body, default=jsonDefault).encode('utf-8')
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if config.DEBUG:
+            http.server.BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+# START SERVING IN THE BACKGROUND
+def start():
+    server = http.server.ThreadingHTTPServer((config.API_HOST, config.API_PORT), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="api", daemon=True)
+    thread.start()
+    print("Query API on http://%s:%s/" % (config.API_HOST or "0.0.0.0", config.API_PORT))
+    return server
@@ -0,0 +1,73 @@
+# SHARED PREDICTION CACHE
+# Upcoming passes are computed once per TLE epoch, and only topped up as
+# passes go by. The current position is whatever the tracker computed
+# last, or computed on demand when that is older than POSITION_TTL.
+# Safe to call from the query API threads.
+#
+
+import datetime
+import math
+import threading
+
+from . import clock
+from . import config
+from . import orbit
+
+glob_lock = threading.Lock()
+glob_passes = []        # upcoming passes, see orbit.nextPasses()
+glob_passKey = None     # TLE line 1 the passes were computed from
+glob_position = None    # last known position, see setPosition()
+
+
+# TLE EPOCH (UTC datetime) OF THE TLE NOW IN USE
+def tleEpoch():
+    return orbit.getISS()._epoch.datetime()
+
+# UPCOMING PASSES, RECOMPUTED ONLY WHEN THE TLE CHANGES
+def passes():
+    global glob_passes
+    global glob_passKey
+    with glob_lock:
+        now = clock.utcnow()
+        key = orbit.glob_tle[1]
+        if (key != glob_passKey):
+            glob_passes = []
+            glob_passKey = key
+        # Drop passes that have ended, then top up from the last one.
+        # A fresh list starts a pass length back, as next_pass skips a
+        # pass that is already under way
+        glob_passes = [p for p in glob_passes if p["set"] > now]
+        if (len(glob_passes) < config.PASS_COUNT):
+            if glob_passes:
+                site = orbit.getSite(glob_passes[-1]["set"] + datetime.timedelta(minutes=1))
+            else:
+                site = orbit.getSite(now - datetime.timedelta(minutes=config.PASS_LOOKBACK))
+            found = orbit.nextPasses(orbit.getISS(), site,
+                                     config.PASS_COUNT - len(glob_passes) + 1)
+            glob_passes += [p for p in found if p["set"] > now]
+            del glob_passes[config.PASS_COUNT:]
+        return list(glob_passes)
+
+# PUBLISH A POSITION THE TRACKER HAS ALREADY COMPUTED
+def setPosition(when, alt, az, sublat, sublong):
+    global glob_position
+    glob_position = {
+        "time":    when,
+        "alt":     alt,
+        "az":      az,
+        "sublat":  sublat,
+        "sublong": sublong,
+        "stamp":   clock.time(),
+    }
+
+# CURRENT POSITION, COMPUTED ONLY IF THE LAST ONE IS STALE
+def position():
+    pos = glob_position
+    if (pos is None or clock.time() - pos["stamp"] > config.POSITION_TTL):
+        now = clock.utcnow()
+        iss = orbit.getISS()
+        alt, az = orbit.lookAngles(iss, orbit.getSite(), now)
+        iss.compute(now)
+        setPosition(now, alt, az, math.degrees(iss.sublat), math.degrees(iss.sublong))
+        pos = glob_position
+    return pos
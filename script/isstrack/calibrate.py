@@ -0,0 +1,218 @@
+# POINTER CALIBRATION AND THROUGHPUT PROFILER
+# Measures what your ESP8266 pointer can really do and writes a profile
+# (config.CALIBRATION) that the tracker loads to time its moves:
+#   - HTTP round trip latency distribution
+#   - shortest pause between commands the ESP wifi buffer copes with
+#   - stepper rate at each RPM, and (with --interactive) the fastest
+#     RPM that does not miss steps
+#   - servo travel time per degree
+#   - gear backlash in steps
+# Timing alone cannot see a stalled stepper or a servo still moving, so
+# with --interactive it also asks you what the pointer did.
+#
+# Usage:
+# python3 -m isstrack.calibrate
+# python3 -m isstrack.calibrate --interactive
+#
+# Replaces testpointer.py. Put a mark under the pointer before starting.
+#
+
+import argparse
+import datetime
+import json
+import statistics
+import time
+
+from . import config
+from .outputs import pointer
+
+RPMS = [5, 10, 15, 20, 30, 40, 50, 60]  # Sketch allows 1 to 60
+GAPS = [0.0, 0.02, 0.05, 0.1, 0.2]
+SERVO_PAUSES = [0.1, 0.2, 0.3, 0.5, 0.8, 1.2]
+STEP_DELAY = 0.001      # Sketch waits DELAY (1ms) after every step
+DEFAULT_RPM = 10        # Kept unless you confirm a faster one works
+
+
+# ASK A YES/NO QUESTION
+def ask(question, default):
+    answer = input("%s [%s] " % (question, "Y/n" if default else "y/N")).strip().lower()
+    if not answer:
+        return default
+    return answer.startswith('y')
+
+# SECONDS ONE COMMAND TAKES (RAW, NO RETRIES)
+def timed(path):
+    t = time.perf_counter()
+    pointer.send(path)
+    return time.perf_counter() - t
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+
+def measureHttp(count):
+    print("\nHTTP round trip (%d requests)..." % count)
+    times = []
+    for i in range(count):
+        times.append(timed("led/" + ("on" if i % 2 else "off")))
+        time.sleep(0.1)
+    http = {
+        "min":    min(times),
+        "median": statistics.median(times),
+        "p90":    percentile(times, 90),
+        "p99":    percentile(times, 99),
+        "max":    max(times),
+    }
+    print("  min %.3fs  median %.3fs  p90 %.3fs  p99 %.3fs  max %.3fs" %
+          (http["min"], http["median"], http["p90"], http["p99"], http["max"]))
+    return http
+
+def measureGap(count):
+    print("\nShortest pause between commands (%d each)..." % count)
+    for gap in GAPS:
+        failures = 0
+        for i in range(count):
+            try:
+                pointer.send("led/" + ("on" if i % 2 else "off"))
+            except Exception:
+                failures += 1
+            time.sleep(gap)
+        print("  %.2fs: %d failures" % (gap, failures))
+        if (failures == 0):
+            return gap
+        time.sleep(2)   # let the ESP recover
+    return GAPS[-1]
+
+def measureSteps(interactive, gap, http):
+    steps = config.STEPS // 4
+    print("\nStepper rate, %d steps out and back at each RPM..." % steps)
+    if interactive:
+        print("  Watch the mark under the pointer")
+    results = []
+    best = RPMS[0]
+    best_time = None
+    pointer.send("stepper/start")
+    for rpm in RPMS:
+        pointer.send("stepper/rpm?" + str(rpm))
+        time.sleep(gap)
+        out = timed("stepper/steps?" + str(steps))
+        time.sleep(gap)
+        back = timed("stepper/steps?-" + str(steps))
+        time.sleep(gap)
+        step_time = max(0.0, ((out + back) / 2 - http["median"]) / steps)
+        expected = 60.0 / (rpm * config.STEPS) + STEP_DELAY
+        keeps_up = step_time <= expected * 1.1
+        ok = keeps_up
+        if (interactive and keeps_up):
+            ok = ask("  %d RPM: is the pointer back on its mark?" % rpm, True)
+        print("  %2d RPM: %.1f ms/step (expect %.1f) %s" %
+              (rpm, step_time * 1000, expected * 1000,
+               ("OK" if interactive else "keeps up") if ok else "FAIL"))
+        results.append({"rpm": rpm, "step_time": step_time, "expected": expected, "ok": ok})
+        if not ok:
+            if interactive:
+                input("  Turn the pointer back onto its mark, then press Enter")
+            break
+        best = rpm
+        best_time = step_time
+    pointer.send("stepper/stop")
+    if not interactive:
+        # The stepper has no feedback, so timing looks fine even when it
+        # misses steps. Only pick a faster RPM once you have watched it.
+        print("  Keeping %d RPM, use --interactive to confirm a faster one" % DEFAULT_RPM)
+        best = DEFAULT_RPM
+        best_time = None
+        for r in results:
+            if (r["rpm"] == best and r["ok"]):
+                best_time = r["step_time"]
+    if best_time is None:
+        best_time = 60.0 / (best * config.STEPS) + STEP_DELAY
+    return best, best_time, results
+
+def measureServo(interactive, speed):
+    if not interactive:
+        settle = speed / 60.0
+        print("\nServo: %.3fs per degree (from --servo-speed)" % settle)
+        return settle
+    print("\nServo travel, 0 to 90 degrees and back with growing pauses...")
+    settle = None
+    for pause in SERVO_PAUSES:
+        pointer.send("servo/value?0")
+        time.sleep(1.5)
+        pointer.send("servo/value?90")
+        time.sleep(pause)
+        pointer.send("servo/value?0")
+        if ask("  %.1fs pause: did it reach straight up before coming back?" % pause, False):
+            settle = pause / 90.0
+            break
+    if settle is None:
+        settle = SERVO_PAUSES[-1] / 90.0
+    print("  %.3fs per degree" % settle)
+    return settle
+
+def measureBacklash(interactive, rpm):
+    if not interactive:
+        return 0
+    print("\nBacklash: the pointer will step forward, then back one step at a time")
+    pointer.send("stepper/start")
+    pointer.send("stepper/rpm?" + str(rpm))
+    pointer.send("stepper/steps?20")
+    backlash = 0
+    sent = 0
+    while (sent < 20):
+        time.sleep(0.5)
+        pointer.send("stepper/steps?-1")
+        sent += 1
+        if ask("  Did the pointer move back?", False):
+            break
+        backlash += 1
+    # Undo what is left of the move
+    if (sent < 20):
+        pointer.send("stepper/steps?-" + str(20 - sent))
+    pointer.send("stepper/stop")
+    print("  %d steps" % backlash)
+    return backlash
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate and profile the ESP8266 pointer")
+    parser.add_argument("--interactive", action="store_true", help="ask what the pointer did")
+    parser.add_argument("--servo-speed", type=float, default=0.12,
+                        help="servo datasheet secs per 60 degrees, without --interactive")
+    parser.add_argument("--count", type=int, default=30, help="requests per latency test")
+    parser.add_argument("--out", default=config.CALIBRATION, help="profile to write")
+    args = parser.parse_args(argv)
+
+    config.DEBUG = 0
+    print("Calibrating pointer at %s" % config.STEPIP)
+    pointer.send("led/on")
+    http = measureHttp(args.count)
+    gap = measureGap(args.count)
+    rpm, step_time, rates = measureSteps(args.interactive, gap, http)
+    settle = measureServo(args.interactive, args.servo_speed)
+    backlash = measureBacklash(args.interactive, rpm)
+    pointer.send("servo/value?0")
+    pointer.send("led/off")
+
+    profile = {
+        "created":      datetime.datetime.utcnow().isoformat() + "Z",
+        "interactive":  args.interactive,
+        "steps":        config.STEPS,
+        "http":         http,
+        "gap":          gap,
+        "rpm":          rpm,
+        "step_time":    step_time,
+        "rates":        rates,
+        "servo_settle": settle,
+        "backlash":     backlash,
+    }
+    with open(args.out, "w") as f:
+        json.dump(profile, f, indent=2)
+    print("\nRPM %d, %.1f ms/step, %.3fs/deg servo, %.2fs between commands, backlash %d" %
+          (rpm, step_time * 1000, settle, gap, backlash))
+    print("Wrote %s" % args.out)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+# CLOCK
+# The tracker reads the time and sleeps through here, so the soak test
+# can run the loop in simulated (accelerated) time. Normally these are
+# just time.time(), datetime.utcnow() and time.sleep().
+#
+
+import datetime
+import time as _time
+
+glob_offset = 0.0       # seconds simulated time is ahead of real time
+glob_onSleep = None     # when simulating, called after every sleep
+
+
+def time():
+    return _time.time() + glob_offset
+
+def utcnow():
+    return datetime.datetime.utcfromtimestamp(time())
+
+def sleep(secs):
+    global glob_offset
+    if glob_onSleep is None:
+        _time.sleep(secs)
+    else:
+        glob_offset += max(0.0, secs)
+        glob_onSleep()
+
+# SLEEPS RETURN AT ONCE AND MOVE THE CLOCK FORWARD INSTEAD
+def simulate(onSleep):
+    global glob_onSleep
+    glob_onSleep = onSleep
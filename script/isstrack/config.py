@@ -0,0 +1,75 @@
+# ISSPointer settings
+# Be sure to edit the USER VARIABLES for your location!
+# Note only passes with altitude angles greater than 10deg will point
+#
+
+############ USER VARIABLES
+DEBUG = 1       # 0 off 1 on
+INFO  = 1       # Display ephemeris info 
+
+# YOUR LOCATION
+LAT = 30.1  # Your Latitude (+N) deg
+LON = -81.8 # Your Longitude (+E) deg
+ELV = 11.0  # Elevation at your location (meters)
+
+# FOR ALT/AZ POINTER 
+STEPIP = "http://192.168.X.X/" # IP Address of YOUR ESP8266 AltAZ Pointer
+STEPS  = 200    # Replace with your stepper (steps per one revolution)
+CALIBRATION = "calibration.json"   # Written by: python3 -m isstrack.calibrate
+
+# OUTPUTS (0 off 1 on) - can also be turned on with --lcd / --audio
+POINTER = 1     # ESP8266 AltAz Pointer
+LCD     = 0     # Adafruit 16x2 RGB LCD on I2C (Raspberry Pi)
+AUDIO   = 0     # Sounds played with aplay (Raspberry Pi)
+
+# LOCAL QUERY API (0 off 1 on) - can also be turned on with --api
+# Serves upcoming passes and current position as JSON to other local tools
+API      = 0
+API_HOST = "127.0.0.1"  # Use "" to allow other machines on your network
+API_PORT = 8266
+
+# TRACK LOG - binary ring buffer of every update, "" for none
+# Dump it with: python3 -m isstrack.tracklog track.bin
+TRACKLOG = "track.bin"
+TRACKLOG_RECORDS = 100000   # ~4MB, oldest records are overwritten
+
+QUIET = [ 0, 7 ] # Don't play audio between midnight & 7:59AM
+PATH = "/home/pi/sounds/"  # Path to Sound files
+
+########### END OF USER VARIABLES
+
+# Global Consts
+FLOAT_A = float(STEPS)/360.0
+HOR = 10.0  # Default to 10 degrees above horizon before being "visible"
+TLE = "https://api.wheretheiss.at/v1/satellites/25544/tles?format=text"
+TLE_CHECK = 20 * 60     # Get TLE Info only every 20 minutes (secs)
+TIMEOUT = 10            # Network timeout (secs)
+
+# Latency compensation
+LATENCY_ALPHA = 0.3     # Weight given to each new latency measurement
+SERVO_SETTLE  = 0.01    # Est. servo travel time (secs per degree)
+
+# Update rate during a pass. Waits until the ISS has moved one stepper
+# step or one servo degree, whichever comes first
+SERVO_RES = 1.0         # Servo resolution (degrees)
+MIN_CHECK = 1.0         # Fastest update during a pass (secs)
+MAX_CHECK = 30.0        # Slowest update during a pass (secs)
+IDLE_CHECK = 60         # Update while ISS below horizon (secs)
+
+# OPTICAL VISIBILITY - ISS sunlit while your sky is dark
+# VISIBLE_ONLY can also be turned on with --visible-only
+VISIBLE_ONLY = 0        # 1 = only wake, alert and point when you can see it
+SUN_ALT = -6.0          # Sky is dark with the Sun below this (deg), -6 = civil twilight
+VISIBLE_STEP = 10       # Check visibility this often along a pass (secs)
+
+# Prediction cache shared by the tracker and the query API
+PASS_COUNT   = 10       # Upcoming passes kept in the cache
+PASS_LOOKBACK = 20      # Search from this long ago so a pass under way is kept (mins)
+POSITION_TTL = 1.0      # Reuse a computed position for this long (secs)
+
+# Retries of TLE and pointer requests (see resilience.py)
+RETRIES = 3             # Retries per request
+BACKOFF_BASE = 0.5      # First retry after about this long (secs), doubling
+BACKOFF_MAX  = 30.0     # Longest wait between retries (secs)
+BREAKER_FAILURES = 5    # Failures in a row before pausing an endpoint
+BREAKER_RESET = 30.0    # Pause before trying a failing endpoint again (secs)
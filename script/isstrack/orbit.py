@@ -0,0 +1,172 @@
+# ISS ORBIT DATA AND POSITION PREDICTION
+#
+# Requires:
+# sudo pip3 install pyephem
+#
+
+try:
+   import ephem
+except Exception as ex:
+   print("Requires sudo pip3 install pyephem")
+   raise SystemExit(1)
+
+import datetime
+import math
+import urllib.request
+
+from . import clock
+from . import config
+from . import resilience
+
+# Global Variables
+glob_tle = []           # used for ISS TLE data
+
+
+def fetchTLE(timeout=None):
+    with urllib.request.urlopen(config.TLE, timeout=timeout or config.TIMEOUT) as resp:
+        tle = resp.read().decode('utf-8').split('\n')
+    if (len(tle) < 3 or not tle[1].startswith('1 ') or not tle[2].startswith('2 ')):
+        raise ValueError("Bad TLE data: %s" % tle)
+    # Parse it too, so a garbled TLE is a failed request and the old one is kept
+    ephem.readtle(*tle[:3])
+    return tle
+
+# GET ISS ORBIT DATA
+# Returns False (keeping any TLE we had) if it cannot be retrieved
+def getTLE():
+    global glob_tle
+    try:
+        glob_tle = resilience.call("TLE", fetchTLE)
+        if config.DEBUG:
+          print (glob_tle)
+        return True
+    except Exception as ex:
+        print("ERROR: Cannot retrieve coordinate data, retrying...")
+        if config.DEBUG:
+          print(ex)
+    return False
+
+# ISS BODY FROM THE LATEST TLE
+def getISS():
+    return ephem.readtle(glob_tle[0], glob_tle[1], glob_tle[2])
+
+# OBSERVER AT YOUR LOCATION
+def getSite(when=None):
+    return makeSite(config.LAT, config.LON, config.ELV, when)
+
+# OBSERVER AT ANY LOCATION (degrees, meters)
+def makeSite(lat, lon, elv, when=None, horizon=None):
+    site = ephem.Observer()
+    site.date = when or clock.utcnow()
+    site.lat = str(lat)
+    site.lon = str(lon)
+    site.horizon = str(config.HOR if horizon is None else horizon)
+    site.elevation = elv
+    site.pressure = 0
+    return site
+
+# PREDICT ISS ALT/AZ (DEGREES) SEEN FROM site AT TIME when
+def lookAngles(iss, site, when):
+    site.date = when
+    iss.compute(site)
+    return (math.degrees(iss.alt), math.degrees(iss.az))
+
+# SIGNED AZIMUTH DIFFERENCE IN -180..180 DEGREES
+def azDelta(a, b):
+    return (a - b + 180.0) % 360.0 - 180.0
+
+# SECONDS UNTIL THE ISS MOVES ONE POINTER STEP OR SERVO DEGREE
+def nextCheck(iss, site, when):
+    alt0, az0 = lookAngles(iss, site, when)
+    alt1, az1 = lookAngles(iss, site, when + datetime.timedelta(seconds=1))
+    azRate  = abs(azDelta(az1, az0))   # deg/sec
+    altRate = abs(alt1 - alt0)         # deg/sec
+    wait = config.MAX_CHECK
+    if (azRate > 0):
+        wait = min(wait, (360.0 / config.STEPS) / azRate)
+    if (altRate > 0):
+        wait = min(wait, config.SERVO_RES / altRate)
+    if config.DEBUG:
+        print("Rates az=%.3f alt=%.3f deg/s, next move in %.1fs" % (azRate, altRate, wait))
+    return wait
+
+# LOCAL TIME OF AN EPHEM DATE OR UTC datetime, WITHOUT MICROSECONDS
+def localTime(date):
+    lt = ephem.localtime(ephem.Date(date))
+    return lt.replace(microsecond=0)
+
+# UPCOMING PASSES OF THE ISS OVER site, STARTING AT site.date
+# Stops after count passes, or at the first pass rising after until
+def nextPasses(iss, site, count=None, until=None):
+    passes = []
+    # ephem's next_pass() ignores site.horizon for a body that has never
+    # been computed, giving the first pass from 0 deg
+    iss.compute(site)
+    while (count is None or len(passes) < count):
+        tr, azr, tt, altt, ts, azs = site.next_pass(iss)
+        if (tr is None or ts is None):
+            break
+        if (until is not None and ephem.Date(tr) > ephem.Date(until)):
+            break
+        passes.append({
+            "rise":     ephem.Date(tr).datetime(),
+            "culmination": ephem.Date(tt).datetime(),
+            "set":      ephem.Date(ts).datetime(),
+            "rise_az":  math.degrees(azr),
+            "max_alt":  math.degrees(altt),
+            "set_az":   math.degrees(azs),
+            "duration": int((ts - tr) *60*60*24),
+            "visible":  visibleSegments(iss, site, ephem.Date(tr).datetime(), ephem.Date(ts).datetime()),
+        })
+        site.date = ts + ephem.minute
+    return passes
+
+# IS THE ISS SUNLIT WHILE THE SKY IS DARK AT site AT TIME when
+def isVisible(iss, sun, site, when):
+    site.date = when
+    iss.compute(site)
+    sun.compute(site)
+    return (not iss.eclipsed and math.degrees(sun.alt) < config.SUN_ALT)
+
+# PARTS OF A PASS WHEN THE ISS CAN BE SEEN BY EYE
+# Checks every VISIBLE_STEP secs, then narrows each change to a second
+def visibleSegments(iss, site, rise, set):
+    sun = ephem.Sun()
+    step = datetime.timedelta(seconds=config.VISIBLE_STEP)
+    second = datetime.timedelta(seconds=1)
+    segments = []
+    was = isVisible(iss, sun, site, rise)
+    start = rise if was else None
+    prev = rise
+    while (prev < set):
+        t = min(prev + step, set)
+        now = isVisible(iss, sun, site, t)
+        if (now != was):
+            lo, hi = prev, t
+            while (hi - lo > second):
+                mid = lo + (hi - lo) / 2
+                if (isVisible(iss, sun, site, mid) == was):
+                    lo = mid
+                else:
+                    hi = mid
+            if now:
+                start = hi
+            else:
+                segments.append({"start": start, "end": hi})
+            was = now
+        prev = t
+    if was:
+        segments.append({"start": start, "end": set})
+    return segments
+
+# FIRST VISIBLE SEGMENT OF passes NOT OVER BY when, AND ITS PASS
+def nextVisible(passes, when):
+    for p in passes:
+        for segment in p["visible"]:
+            if (segment["end"] > when):
+                return p, segment
+    return None, None
+
+# SECONDS FROM NOW UNTIL AN EPHEM DATE
+def secondsUntil(date):
+    return (ephem.Date(date) - ephem.Date(clock.utcnow())) * 60*60*24
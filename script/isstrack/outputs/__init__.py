@@ -0,0 +1,48 @@
+# OUTPUT BACKENDS
+# Each output is a module in this package and is only imported (and its
+# hardware only opened) when it is enabled. An output may define any of
+# these hooks, which the tracker calls in the order outputs were loaded:
+#
+#   init()                 -- open hardware, return False if not present
+#   startup()              -- tracker starting
+#   track(iss, site)       -- ISS above horizon, follow it
+#   alert(level, duration) -- ISS reached a new level this pass
+#                             (1 visible, 2 overhead, 3 above 60deg)
+#   idle(risetime)         -- ISS below horizon, next pass at risetime
+#   quiet(state)           -- quiet hours on (True) or off (False)
+#   shutdown()             -- tracker exiting
+#
+
+import importlib
+import time
+
+from .. import config
+
+
+# IMPORT AND INITIALIZE THE NAMED OUTPUTS
+def load(names):
+    outputs = []
+    for name in names:
+        try:
+            out = importlib.import_module("." + name, __name__)
+            init = getattr(out, "init", None)
+            if init is not None and init() is False:
+                print("No %s output found. Ignored..." % name)
+                continue
+            outputs.append(out)
+        except Exception as ex:
+            print("No %s output found. Ignored..." % name)
+            print(ex)
+    return outputs
+
+# CALL A HOOK ON EVERY OUTPUT THAT HAS IT
+def notify(outputs, hook, *args):
+    for out in outputs:
+        fn = getattr(out, hook, None)
+        if fn is not None:
+            fn(*args)
+
+# QUIET TIME, NO SOUND OR BACKLIGHT
+def isQuiet():
+    hour = int(time.strftime('%H'))
+    return (hour >= config.QUIET[0] and hour < config.QUIET[1])
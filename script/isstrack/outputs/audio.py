@@ -0,0 +1,43 @@
+# SOUND ALERTS FOR RASPBERRY PI WITH EXTERNAL AUDIO SPEAKER
+# Sounds are played with aplay from config.PATH
+#
+
+import os
+import subprocess
+import time
+
+from .. import config
+from . import isQuiet
+
+APLAY = '/usr/bin/aplay'
+SOUND = [ 0, "2001buzz.wav","2001ping.wav","2001function.wav","2001alarm.wav" ]
+
+
+def init():
+    return os.path.exists(APLAY)
+
+def sound(val): # Play a sound
+    time.sleep(1)
+    sndfile = config.PATH+SOUND[val]
+    subprocess.call([APLAY, sndfile], stderr=subprocess.PIPE)
+    return
+
+
+## OUTPUT HOOKS
+
+def startup():
+    sound(3)
+
+def alert(level, duration):
+    if isQuiet():
+        return
+    if (level == 3):
+        sound(4)
+    elif (level == 2):
+        sound(2)
+        sound(2)
+        sound(2)
+    else:
+        sound(1)
+        sound(1)
+        sound(1)
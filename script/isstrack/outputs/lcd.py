@@ -0,0 +1,77 @@
+# ADAFRUIT 16x2 RGB LCD OUTPUT FOR RASPBERRY PI
+# Displays next time ISS is visible and alerts when it is overhead
+#
+# Install Adafruit LCD lib & dependencies from 
+#    https://github.com/adafruit/Adafruit_CircuitPython_CharLCD
+#
+
+import time
+
+from ..orbit import localTime
+
+lcd_columns = 16
+lcd_rows = 2
+lcd = None
+
+
+def init():
+    # Imported here so the I2C stack is only loaded when the LCD is enabled
+    global lcd
+    import adafruit_character_lcd.character_lcd_rgb_i2c as character_lcd
+    import board
+    import busio
+    i2c = busio.I2C(board.SCL, board.SDA)
+    lcd = character_lcd.Character_LCD_RGB_I2C(i2c, lcd_columns, lcd_rows)
+
+def flash_display():    # LCD Display flash
+    for i in range(3):
+        lcd.color = [0, 0, 0]
+        time.sleep(0.4)
+        lcd.color = [100, 0, 0]
+        time.sleep(0.4)
+
+
+## OUTPUT HOOKS
+
+def startup():
+    lcd.clear()
+    lcd.backlight = True
+    lcd.color = [100, 0, 0]
+    lcd.message = "ISS STARTUP\n LCD version"
+    flash_display()
+
+def alert(level, duration):
+    lcd.clear()
+    lcd.backlight = True
+    lcd.color = [100, 0, 0]
+    if (level > 1):
+        lcd.message = ("ISS IS OVERHEAD")
+    else:
+        lcd.message = ("ISS IS VISIBLE\nDuration:" + str(duration) + "sec")
+    flash_display()
+
+def idle(risetime): # LCD Display dates/times
+    v = "none soon"
+    if risetime is not None:
+        v = localTime(risetime).strftime('%m/%d %X')
+    c = time.strftime('%m/%d %X')
+    lcd.clear()
+    lcd.color = [100, 0, 0]
+    message = ("NEXT:" + v)
+    message += ("\n")
+    message += ("Time:" + c)
+    lcd.message = message
+
+# Turn off LCD backlight during quiet time 
+def quiet(state):
+    if not state:
+        lcd.backlight = True
+        lcd.color = [100, 0, 0]
+    else:
+        lcd.backlight = False
+        lcd.color = [0, 0, 0]
+
+def shutdown():
+    lcd.clear()
+    lcd.backlight = False
+    lcd.color = [0, 0, 0]
@@ -0,0 +1,266 @@
+# ESP8266 ALT/AZ POINTER OUTPUT
+# It requires the AltAzPointer project: 
+# http://www.instructables.com/id/ESP8266-ISSPointer
+#
+
+import datetime
+import json
+import urllib.request
+
+from .. import clock
+from .. import config
+from .. import resilience
+from .. import tracklog
+from ..orbit import lookAngles, azDelta
+
+# Global Variables
+glob_azOld   = 0.0      # AZ deg the pointer was last stepped to
+glob_azReset = 0        # used to reset pointer north at end of run
+glob_altOld  = 0        # used to estimate servo travel
+glob_overheadAz  = 0.5  # rolling est. of AZ command time, less the move (secs)
+glob_overheadAlt = 1.0  # rolling est. of ALT command time, less both moves (secs)
+glob_lastDir = 0        # direction of the last stepper move (+1/-1)
+glob_rpmSet  = False    # RPM has been sent to the ESP
+glob_ledOn   = False    # LED has been turned on for this pass
+
+# From the calibration profile, if there is one (see calibrate.py)
+glob_rpm      = 10      # stepper RPM
+glob_gap      = 0.1     # pause between commands (secs)
+glob_backlash = 0       # steps lost when the stepper changes direction
+glob_stepTime = None    # secs per step at glob_rpm, None to work it out
+
+
+# LOAD THE CALIBRATION PROFILE WRITTEN BY calibrate.py
+def loadCalibration(path):
+    global glob_rpm
+    global glob_gap
+    global glob_backlash
+    global glob_stepTime
+    global glob_overheadAz
+    global glob_overheadAlt
+    # Read everything before changing anything, so a partial or old
+    # profile leaves all the defaults in place
+    try:
+        with open(path) as f:
+            profile = json.load(f)
+        rpm = int(profile["rpm"])
+        gap = float(profile["gap"])
+        backlash = int(profile["backlash"])
+        stepTime = float(profile["step_time"])
+        settle = float(profile["servo_settle"])
+        http = float(profile["http"]["median"])
+    except FileNotFoundError:
+        print("No pointer calibration, using defaults. Run: python3 -m isstrack.calibrate")
+        return
+    except Exception as ex:
+        print("ERROR: Bad pointer calibration %s, using defaults" % path)
+        print(ex)
+        return
+    glob_rpm = rpm
+    glob_gap = gap
+    glob_backlash = backlash
+    glob_stepTime = stepTime
+    config.SERVO_SETTLE = settle
+    # Starting guesses, the rolling estimates take over. The servo is
+    # sent after the stepper/steps and stepper/stop commands
+    glob_overheadAz  = http
+    glob_overheadAlt = 3 * http + 2 * gap
+    if config.DEBUG:
+        print("Pointer calibration:", profile)
+
+
+# SECONDS ONE STEP TAKES AT glob_rpm
+# The sketch also waits 1ms after every step
+def stepTime():
+    if glob_stepTime:
+        return glob_stepTime
+    return 60.0 / (glob_rpm * config.STEPS) + 0.001
+
+# SECONDS THE STEPPER TAKES TO MOVE steps
+def azMoveTime(steps):
+    return abs(steps) * stepTime()
+
+# SECONDS THE SERVO TAKES TO MOVE deg
+def altMoveTime(deg):
+    return config.SERVO_SETTLE * abs(deg)
+
+# SEND ONE COMMAND TO THE ESP8266
+# Returns the time the ESP replied
+def send(path, timeout=None):
+    cmd = config.STEPIP+path
+    with urllib.request.urlopen(cmd, timeout=timeout or config.TIMEOUT) as resp:
+        reply = resp.read()
+    replied = clock.time()
+    if config.DEBUG:
+        print (cmd)
+        print(reply)
+    return replied
+
+# SEND ONE COMMAND TO THE ESP8266, WITH RETRIES
+# Only for commands that are safe to repeat (see doStepper)
+# Returns the time the ESP replied
+def command(path, retries=None, timeout=None, deadline=True):
+    replied = resilience.call("Pointer", send, path, retries=retries,
+                              timeout=timeout, deadline=deadline)
+    clock.sleep(glob_gap) # keep from overflowing ESP wifi buffer
+    return replied
+
+# CONTROL LED
+def doLED(state):
+    global glob_ledOn
+    try:
+        command("led/"+str(state))
+        glob_ledOn = (state == 'on')
+    except Exception as ex:
+        print("ERROR: LED comm failure:", ex)
+
+# CONTROL AZIMUTH STEPPER MOTOR
+def doStepper(steps):
+    # Returns time the stepper finished moving, or None
+    global glob_lastDir
+    global glob_rpmSet
+    global glob_ledOn
+    arrived = None
+    if (steps == 0):
+        return arrived
+    try:
+       # The ESP turns the motor on for each move, so no stepper/start,
+       # and keeps the RPM until it restarts
+       if not glob_rpmSet:
+           command("stepper/rpm?"+str(glob_rpm))
+           glob_rpmSet = True
+       # Take up gear backlash when changing direction
+       direction = 1 if steps > 0 else -1
+       if (glob_lastDir != 0 and direction != glob_lastDir):
+           steps += direction * glob_backlash
+       glob_lastDir = direction
+       steps = max(-config.STEPS, min(config.STEPS, steps))
+       # ESP replies after the steps are done, so wait for the move too,
+       # even past the deadline as it cannot be stopped part way.
+       # Never retried: if only the reply was lost, a retry moves twice
+       arrived = command("stepper/steps?"+str(steps), retries=0,
+                         timeout=config.TIMEOUT + azMoveTime(steps), deadline=False)
+       command("stepper/stop")
+    except Exception as ex:
+       glob_rpmSet = False  # the ESP may have restarted
+       glob_ledOn = False
+       print("Unexpected doStepper() error:", ex)
+       try:
+           command("stepper/stop")
+       except Exception:
+           print("Stepper comm failure")
+    return arrived
+
+# CONTROL ALTITUDE SERVO
+def doServo(angle):
+    # Returns time the servo command was accepted, or None
+    if (angle < 0 ):
+        angle = 0
+    if (angle > 90 ):
+        angle = 90
+    try:
+        return command("servo/value?"+str(angle))
+    except Exception as ex:
+        print("Servo comm failure:", ex)
+    return None
+
+# CONTROL RESET TO NORTH & LEVEL POSITION
+def doAzReset():
+    # Reset back to point north
+    global glob_azOld
+    global glob_azReset
+    global glob_altOld
+    glob_azOld   = 0.0
+    glob_altOld  = 0
+    if config.DEBUG:
+        print(("doAzReset("+str(glob_azReset)+")"))
+    if (glob_azReset != 0):
+        steps = glob_azReset
+        clock.sleep(0.2)
+        doStepper(-steps)
+        glob_azReset = 0
+        doServo(0)
+        doLED('off')
+    elif glob_ledOn:
+        doLED('off')
+    return
+
+# ROLLING (EXPONENTIAL) AVERAGE OF COMMAND LATENCY
+def updateLatency(old, sample):
+    return (1.0 - config.LATENCY_ALPHA) * old + config.LATENCY_ALPHA * sample
+
+
+## OUTPUT HOOKS
+
+def init():
+    loadCalibration(config.CALIBRATION)
+
+def track(iss, site):
+    global glob_azOld
+    global glob_azReset
+    global glob_altOld
+    global glob_overheadAz
+    global glob_overheadAlt
+
+    # Send to AltAz Pointer, turning the LED on once per pass
+    if not glob_ledOn:
+        doLED('on')
+
+    # Aim where the ISS will be when each axis arrives, not where
+    # it was at the top of the loop. Arrival is the command overhead
+    # (rolling estimate) plus the move, which depends on the aim, so
+    # the aim is worked out again from the first one. The servo is only
+    # sent once the stepper is done
+    t0  = clock.time()
+    now = clock.utcnow()
+    altAim, azAim = lookAngles(iss, site, now)
+    for i in range(2):
+        steps = int(round((azAim - glob_azOld) * config.FLOAT_A))
+        azLead = glob_overheadAz + azMoveTime(steps)
+        azAim = lookAngles(iss, site, now + datetime.timedelta(seconds=azLead))[1]
+    steps = int(round((azAim - glob_azOld) * config.FLOAT_A))
+    for i in range(2):
+        altLead = glob_overheadAlt + azMoveTime(steps) + altMoveTime(int(altAim) - glob_altOld)
+        altAim = lookAngles(iss, site, now + datetime.timedelta(seconds=altLead))[0]
+    altDeg = int(altAim)
+
+    # Point Servo towards ISS
+    # Convert AZ deg to 200 steps
+    # Find the difference between current location and new location
+    # (keep the part of a step not yet moved for next time)
+    glob_azOld += steps / config.FLOAT_A
+    azArrived = doStepper(steps)
+    glob_azReset += steps
+    # Only move the servo when the ISS has moved a whole degree
+    altArrived = None
+    if (altDeg != glob_altOld):
+        altMove = altMoveTime(altDeg - glob_altOld)
+        altArrived = doServo(altDeg)
+        if (altArrived is not None):
+            altArrived += altMove
+        glob_altOld = altDeg
+
+    # Update rolling overhead estimates and report residual lag,
+    # i.e. how far the ISS is from where we aimed when we got there.
+    # The known move times are taken out, so one long slew does not
+    # throw off the aim of the small moves after it
+    tracklog.command(steps=steps, angle=glob_altOld)
+    if (azArrived is not None):
+        tracklog.command(latency_az=azArrived - t0)
+        glob_overheadAz = updateLatency(glob_overheadAz,
+                                        max(0.0, azArrived - t0 - azMoveTime(steps)))
+        azAct = lookAngles(iss, site, now + datetime.timedelta(seconds=azArrived - t0))[1]
+        if config.INFO:
+            print("AZ  latency: %.2fs  lag: %.2f deg  (uncompensated %.2f deg)" %
+                  (azArrived - t0, azDelta(azAct, azAim), azDelta(azAct, lookAngles(iss, site, now)[1])))
+    if (altArrived is not None):
+        tracklog.command(latency_alt=altArrived - t0)
+        glob_overheadAlt = updateLatency(glob_overheadAlt,
+                                         max(0.0, altArrived - t0 - azMoveTime(steps) - altMove))
+        altAct = lookAngles(iss, site, now + datetime.timedelta(seconds=altArrived - t0))[0]
+        if config.INFO:
+            print("ALT latency: %.2fs  lag: %.2f deg  (uncompensated %.2f deg)" %
+                  (altArrived - t0, altAct - altAim, altAct - lookAngles(iss, site, now)[0]))
+
+def idle(risetime):
+    doAzReset()
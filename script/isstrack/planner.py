@@ -0,0 +1,165 @@
+# MULTI-SITE ISS PASS PLANNER
+# Works out how many good (and visible) ISS passes each of many candidate sites gets
+# over a date range, to help decide where to put pointers. Sites are
+# spread over a process pool, one core each.
+#
+# Usage:
+# python3 -m isstrack.planner --sites sites.csv --days 30 --out plan.csv
+# python3 -m isstrack.planner --grid 25:50:0.5,-125:-65:0.5 --out plan.parquet
+#
+# sites.csv has lat,lon and optional elv,name columns (degrees, meters).
+# Parquet output needs: sudo pip3 install pandas pyarrow
+#
+
+import argparse
+import csv
+import datetime
+import multiprocessing
+import os
+import sys
+import time
+
+from . import config
+from . import orbit
+
+FIELDS = ["name", "lat", "lon", "elv", "passes", "overhead", "max_alt",
+          "mean_max_alt", "total_duration", "mean_duration", "visible",
+          "visible_duration"]
+
+# Per worker process
+glob_iss = None
+glob_range = None
+
+
+# READ SITES FROM A CSV FILE
+def readSites(path):
+    sites = []
+    with open(path, newline='') as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            lat = float(row["lat"])
+            lon = float(row["lon"])
+            elv = float(row.get("elv") or 0.0)
+            sites.append((row.get("name") or str(i), lat, lon, elv))
+    return sites
+
+# SITES ON A LAT/LON GRID "LAT0:LAT1:STEP,LON0:LON1:STEP"
+# Raises ValueError if spec is not a valid grid
+def gridSites(spec):
+    def steps(part):
+        lo, hi, step = [float(v) for v in part.split(':')]
+        if (step <= 0 or hi < lo):
+            raise ValueError("need LO <= HI and STEP > 0 in %s" % part)
+        n = int(round((hi - lo) / step)) + 1
+        return [lo + i * step for i in range(n)]
+    lats, lons = spec.split(',')
+    return [("%.4f,%.4f" % (lat, lon), lat, lon, 0.0)
+            for lat in steps(lats) for lon in steps(lons)]
+
+def initWorker(tle, start, end, horizon):
+    global glob_iss
+    global glob_range
+    orbit.glob_tle = tle
+    glob_iss = orbit.getISS()
+    glob_range = (start, end, horizon)
+
+# ALL PASSES OVER ONE SITE, SUMMARIZED
+def planSite(site):
+    name, lat, lon, elv = site
+    start, end, horizon = glob_range
+    obs = orbit.makeSite(lat, lon, elv, start, horizon)
+    try:
+        passes = orbit.nextPasses(glob_iss, obs, until=end)
+    except ValueError:
+        # ephem: the ISS never rises here (polar sites)
+        passes = []
+    n = len(passes)
+    alts = [p["max_alt"] for p in passes]
+    total = sum(p["duration"] for p in passes)
+    seen = [p for p in passes if p["visible"]]
+    seenTime = sum((s["end"] - s["start"]).total_seconds() for p in seen for s in p["visible"])
+    return {
+        "name": name, "lat": lat, "lon": lon, "elv": elv,
+        "passes": n,
+        "overhead": sum(1 for a in alts if a > 45),
+        "max_alt": round(max(alts), 2) if n else 0.0,
+        "mean_max_alt": round(sum(alts) / n, 2) if n else 0.0,
+        "total_duration": total,
+        "mean_duration": round(total / n, 1) if n else 0.0,
+        "visible": len(seen),
+        "visible_duration": int(seenTime),
+    }
+
+def writeResults(path, rows):
+    if path.endswith(".parquet"):
+        try:
+            import pandas
+        except ImportError:
+            print("Parquet output requires sudo pip3 install pandas pyarrow")
+            raise SystemExit(1)
+        pandas.DataFrame(rows, columns=FIELDS).to_parquet(path, index=False)
+        return
+    out = sys.stdout if path == "-" else open(path, "w", newline='')
+    try:
+        writer = csv.DictWriter(out, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plan ISS passes for many sites")
+    where = parser.add_mutually_exclusive_group(required=True)
+    where.add_argument("--sites", help="CSV file with lat,lon[,elv,name] columns")
+    where.add_argument("--grid", help="LAT0:LAT1:STEP,LON0:LON1:STEP")
+    parser.add_argument("--start", help="UTC start date YYYY-MM-DD (default today)")
+    parser.add_argument("--days", type=float, default=7, help="days to plan (default 7)")
+    parser.add_argument("--horizon", type=float, default=config.HOR, help="min altitude deg")
+    parser.add_argument("--tle", help="file with the 3 line TLE (default: download)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes")
+    parser.add_argument("--out", default="-", help="output .csv or .parquet (default stdout)")
+    args = parser.parse_args(argv)
+
+    if args.sites:
+        sites = readSites(args.sites)
+    else:
+        try:
+            sites = gridSites(args.grid)
+        except ValueError as ex:
+            parser.error("--grid LAT0:LAT1:STEP,LON0:LON1:STEP: %s" % ex)
+    if args.start:
+        start = datetime.datetime.strptime(args.start, "%Y-%m-%d")
+    else:
+        start = datetime.datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    end = start + datetime.timedelta(days=args.days)
+
+    if args.tle:
+        with open(args.tle) as f:
+            orbit.glob_tle = f.read().split('\n')
+    else:
+        orbit.getTLE()
+    if len(orbit.glob_tle) < 3:
+        print("ERROR: No TLE data")
+        raise SystemExit(1)
+    # Check it here: a bad TLE would kill every worker as it starts, and
+    # the pool would keep starting new ones
+    try:
+        orbit.getISS()
+    except ValueError as ex:
+        print("ERROR: Bad TLE data:", ex)
+        raise SystemExit(1)
+
+    # Big chunks keep the pool busy with little pickling between processes
+    t0 = time.time()
+    chunk = max(1, len(sites) // (args.workers * 8))
+    with multiprocessing.Pool(args.workers, initWorker,
+                              (orbit.glob_tle, start, end, args.horizon)) as pool:
+        rows = pool.map(planSite, sites, chunksize=chunk)
+    writeResults(args.out, rows)
+    print("Planned %d sites x %g days in %.1fs on %d workers" %
+          (len(sites), args.days, time.time() - t0, args.workers), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
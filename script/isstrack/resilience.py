@@ -0,0 +1,113 @@
+# I/O RESILIENCE FOR THE TLE API AND THE POINTER
+# Retries use jittered exponential backoff, and neither the attempts
+# nor the sleeps between them run past the current deadline (the next
+# pass, or the next update during a pass).
+# Each endpoint has a circuit breaker: after BREAKER_FAILURES failures
+# in a row calls fail at once for BREAKER_RESET secs, then one trial
+# call is let through to see if it is back.
+#
+
+import random
+
+from . import clock
+from . import config
+
+glob_breakers = {}      # endpoint name -> Breaker
+glob_deadline = None    # clock.time() that retries must finish by
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+class DeadlinePassed(Exception):
+    pass
+
+
+class Breaker:
+
+    def __init__(self, name):
+        self.name = name
+        self.failures = 0
+        self.openedAt = None
+
+    # May a call go through now?
+    def allow(self):
+        if self.openedAt is None:
+            return True
+        # Half open: let one trial call through after the reset time
+        return clock.time() - self.openedAt >= config.BREAKER_RESET
+
+    def success(self):
+        if self.openedAt is not None:
+            print("%s back online" % self.name)
+        self.failures = 0
+        self.openedAt = None
+
+    def failure(self):
+        self.failures += 1
+        if (self.failures >= config.BREAKER_FAILURES):
+            if self.openedAt is None:
+                print("%s failing, pausing calls for %ss" % (self.name, config.BREAKER_RESET))
+            self.openedAt = clock.time()
+
+
+def breaker(name):
+    if name not in glob_breakers:
+        glob_breakers[name] = Breaker(name)
+    return glob_breakers[name]
+
+# RETRIES MUST NOT SLEEP PAST when (a clock.time()), or None for no limit
+def setDeadline(when):
+    global glob_deadline
+    glob_deadline = when
+
+# JITTERED EXPONENTIAL BACKOFF (secs) BEFORE RETRY attempt (0 = first retry)
+def backoff(attempt):
+    # Exponent capped so a long outage cannot overflow the float
+    delay = min(config.BACKOFF_MAX, config.BACKOFF_BASE * (2 ** min(attempt, 16)))
+    return delay * random.uniform(0.5, 1.0)
+
+# SECONDS AN ATTEMPT MAY TAKE: timeout, cut short by the deadline
+def attemptTimeout(endpoint, timeout):
+    if glob_deadline is None:
+        return timeout
+    left = glob_deadline - clock.time()
+    if (left <= 0):
+        raise DeadlinePassed("%s: no time left before the deadline" % endpoint)
+    return min(timeout, left)
+
+# CALL fn(*args, timeout=secs) FOR endpoint, RETRYING ON ANY Exception
+# Each attempt gets timeout (default TIMEOUT) secs, or what is left
+# before the deadline. deadline=False is for calls that cannot be given
+# up part way (a stepper move), they get their whole timeout.
+# Raises CircuitOpen if the endpoint's breaker is open, DeadlinePassed
+# if there is no time left, or the last error when out of retries or
+# out of time before the deadline
+def call(endpoint, fn, *args, retries=None, timeout=None, deadline=True):
+    b = breaker(endpoint)
+    if retries is None:
+        retries = config.RETRIES
+    if timeout is None:
+        timeout = config.TIMEOUT
+    attempt = 0
+    while True:
+        if not b.allow():
+            raise CircuitOpen("%s circuit open" % endpoint)
+        secs = attemptTimeout(endpoint, timeout) if deadline else timeout
+        try:
+            result = fn(*args, timeout=secs)
+        except Exception as ex:
+            b.failure()
+            if (attempt >= retries or not b.allow()):
+                raise
+            delay = backoff(attempt)
+            if (glob_deadline is not None and clock.time() + delay > glob_deadline):
+                raise
+            if config.DEBUG:
+                print("%s error: %s, retry in %.1fs" % (endpoint, ex, delay))
+            clock.sleep(delay)
+            attempt += 1
+            continue
+        b.success()
+        return result
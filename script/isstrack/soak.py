@@ -0,0 +1,163 @@
+# LONG-RUN SOAK TEST
+# Runs the real tracking loop for simulated weeks in accelerated time
+# against local stand-ins for the TLE API and the ESP8266 pointer, and
+# watches memory, file descriptors and sockets for leaks. Linux only
+# (reads /proc/self).
+#
+# Usage:
+# python3 -m isstrack.soak --days 28
+# python3 -m isstrack.soak --days 7 --tle iss.tle --max-rss 2
+#
+# Exits 1 if anything grew more than allowed after the warm-up.
+#
+
+import argparse
+import contextlib
+import datetime
+import http.server
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+import urllib.request
+
+from . import clock
+from . import config
+from . import outputs
+from . import tracker
+
+PAGE = resource.getpagesize()
+
+
+# STAND-IN FOR THE TLE API AND THE ESP8266 POINTER
+class StandIn(http.server.BaseHTTPRequestHandler):
+    tle = ""
+
+    def do_GET(self):
+        if "tles" in self.path:
+            body = self.tle
+        else:
+            body = "OK: " + self.path
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# RSS (MB), OPEN FDS, OPEN SOCKETS AND TRACED HEAP (MB) OF THIS PROCESS
+def sample():
+    with open("/proc/self/statm") as f:
+        rss = int(f.read().split()[1]) * PAGE / 1e6
+    fds = 0
+    socks = 0
+    for fd in os.listdir("/proc/self/fd"):
+        try:
+            link = os.readlink("/proc/self/fd/" + fd)
+        except OSError:
+            continue    # the listdir fd itself, already closed
+        fds += 1
+        if link.startswith("socket:"):
+            socks += 1
+    heap = tracemalloc.get_traced_memory()[0] / 1e6
+    return {"rss": rss, "fds": fds, "sockets": socks, "heap": heap}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soak test the tracking loop in simulated time")
+    parser.add_argument("--days", type=float, default=28, help="simulated days (default 28)")
+    parser.add_argument("--warmup", type=float, default=1, help="simulated days before baseline")
+    parser.add_argument("--sample", type=float, default=6, help="simulated hours between samples")
+    parser.add_argument("--tle", help="file with the 3 line TLE (default: download once)")
+    parser.add_argument("--max-rss", type=float, default=5.0, help="allowed RSS growth MB")
+    parser.add_argument("--max-heap", type=float, default=2.0, help="allowed traced heap growth MB")
+    parser.add_argument("--max-fds", type=int, default=2, help="allowed open fd growth")
+    parser.add_argument("--top", type=int, default=10, help="allocation sites to show")
+    args = parser.parse_args(argv)
+
+    if args.tle:
+        with open(args.tle) as f:
+            StandIn.tle = f.read()
+    else:
+        with urllib.request.urlopen(config.TLE, timeout=config.TIMEOUT) as resp:
+            StandIn.tle = resp.read().decode('utf-8')
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:%d/" % server.server_address[1]
+    config.TLE = url + "tles"
+    config.STEPIP = url
+    config.TRACKLOG = ""
+    config.DEBUG = 0
+    config.INFO = 0
+    config.API = 0
+
+    tracemalloc.start(10)
+    begin = clock.utcnow()
+    warm = begin + datetime.timedelta(days=args.warmup)
+    end = begin + datetime.timedelta(days=args.days)
+    step = datetime.timedelta(hours=args.sample)
+    state = {"next": begin + step, "base": None, "snap": None, "samples": []}
+    real = time.time()
+
+    def onSleep():
+        now = clock.utcnow()
+        if (now < state["next"]):
+            return
+        state["next"] = now + step
+        s = sample()
+        s["day"] = (now - begin).total_seconds() / 86400
+        state["samples"].append(s)
+        if (state["base"] is None and now >= warm):
+            state["base"] = s
+            state["snap"] = tracemalloc.take_snapshot()
+
+    clock.simulate(onSleep)
+    outs = outputs.load(["pointer"])
+    # Keep the printing (it is part of the loop) but not the output
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        tracker.run(outs, until=end)
+    server.shutdown()
+
+    print("Simulated %g days in %.0fs" % (args.days, time.time() - real))
+    print("%6s %9s %9s %5s %7s" % ("day", "rss MB", "heap MB", "fds", "sockets"))
+    for s in state["samples"]:
+        print("%6.2f %9.2f %9.2f %5d %7d" % (s["day"], s["rss"], s["heap"], s["fds"], s["sockets"]))
+
+    base = state["base"]
+    if base is None:
+        print("Run too short for a baseline, use more --days than --warmup")
+        return 1
+    last = sample()
+    growth = {k: last[k] - base[k] for k in ("rss", "heap", "fds", "sockets")}
+    print("Growth after warm-up: rss %+.2f MB  heap %+.2f MB  fds %+d  sockets %+d" %
+          (growth["rss"], growth["heap"], growth["fds"], growth["sockets"]))
+
+    print("Top allocation growth:")
+    stats = tracemalloc.take_snapshot().compare_to(state["snap"], 'lineno')
+    for stat in stats[:args.top]:
+        print("  %s" % stat)
+
+    failed = []
+    if (growth["rss"] > args.max_rss):
+        failed.append("RSS")
+    if (growth["heap"] > args.max_heap):
+        failed.append("heap")
+    if (growth["fds"] > args.max_fds or growth["sockets"] > args.max_fds):
+        failed.append("file descriptors/sockets")
+    if failed:
+        print("FAIL: %s grew more than allowed" % ", ".join(failed))
+        return 1
+    print("PASS")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,249 @@
+# ISS FLYOVER DETECTION AND TRACKING LOOP
+#
+
+import argparse
+import atexit
+import datetime
+import math
+import socket
+
+from . import cache
+from . import clock
+from . import config
+from . import orbit
+from . import outputs
+from . import resilience
+from . import tracklog
+
+
+def exit_handler(outs):
+    try:
+        outputs.notify(outs, 'shutdown')
+        tracklog.stop()
+        print("EXITING")  
+    except:
+        # avoids ugly KeyboardInterrupt trace on console...
+        pass
+
+# ISS ALERT LEVEL FOR AN ALTITUDE (0 below horizon, 1 visible, 2 overhead, 3 above 60deg)
+def alertLevel(altDeg):
+    if ( altDeg > int(60) ):
+        return 3
+    if ( altDeg > int(45) ):
+        return 2
+    if ( altDeg > int(config.HOR) ):
+        return 1
+    return 0
+
+
+#####
+# MAIN LOOP
+def run(outs, start=None, until=None):
+  start = start or clock.time()
+
+  # timeout in seconds
+  socket.setdefaulttimeout(config.TIMEOUT)
+
+  outputs.notify(outs, 'startup')
+  tracklog.start()
+
+  if config.API:
+      from . import api
+      api.start()
+
+  if config.DEBUG:
+      print("DEBUG MODE")
+
+  # This is to allow getting the TLE after restarts
+  pt = clock.utcnow() - datetime.timedelta(hours=1)
+    
+  duration = 0        # Duration of a flyover in seconds
+  alert = 0           # highest alert level given this pass
+  first = True        # first pointing update since startup
+  tle = None          # TLE the ISS body was built from
+  site = orbit.getSite()
+  tr = ts = None      # rise and set of the next (or current) pass
+  errors = 0          # prediction errors in a row
+
+  while (until is None or clock.utcnow() < until):
+    print("\n")
+    print("ISS PASS INFO")
+
+    # Get TLE Info only every 20 minutes
+    # just left math for clarity, not speed
+    ct = clock.utcnow()
+
+    # Retries of failed requests may not hold up the next pass, or the
+    # next update during one
+    if (tr is not None and ct < tr):
+        resilience.setDeadline(clock.time() + orbit.secondsUntil(tr))
+    elif (ts is not None and ct < ts):
+        resilience.setDeadline(clock.time() + config.MIN_CHECK)
+    else:
+        resilience.setDeadline(None)
+
+    next_seconds = int((ct - pt).total_seconds())
+    if config.DEBUG:
+      print(("Seconds since last TLE check: %s" % next_seconds))
+    # A TLE fetch retrying through an outage would hold up a pass, so
+    # the one already loaded is kept until the pass is over
+    inPass = (orbit.glob_tle and tr is not None and ts is not None and tr <= ct < ts)
+    if ((next_seconds > config.TLE_CHECK and not inPass) or not orbit.glob_tle):
+        if orbit.getTLE():
+            pt = ct
+    if not orbit.glob_tle:
+        # Nothing to track with until the first TLE arrives
+        clock.sleep(resilience.backoff(errors))
+        errors += 1
+        continue
+
+    # Reuse the ISS body and observer, only rebuilding on a new TLE
+    if (orbit.glob_tle != tle):
+        tle = orbit.glob_tle
+        iss = orbit.getISS()
+    site.date = clock.utcnow()
+
+    lt = orbit.localTime(site.date)
+    print("Current UTC time    : %s" % site.date)
+    print("Current Local time  : %s" % lt)
+
+    # FIND NEXT PASS INFO (OR THE PASS UNDER WAY)
+    # Read from the cache, which only works it out once per pass:
+    # ephem's next_pass() leaks a little memory on every call
+    try:
+        passes = cache.passes()
+        nextPass = passes[0]
+    except Exception as ex:
+        print(ex)
+        clock.sleep(resilience.backoff(errors))
+        errors += 1
+        continue
+    errors = 0
+
+    tr = nextPass["rise"]
+    ts = nextPass["set"]
+    if config.DEBUG:
+         print("tr=%s  ts=%s" % (tr,ts))
+
+    duration = nextPass["duration"]
+    lt = orbit.localTime(tr)
+    print(("Next Pass Local time: %s" % lt))
+    print("")
+    if config.INFO:
+        print(("UTC Rise Time   : %s" % tr.replace(microsecond=0)))
+        print(("UTC Max Alt Time: %s" % nextPass["culmination"].replace(microsecond=0)))
+        print(("UTC Set Time    : %s" % ts.replace(microsecond=0)))
+        print(("Rise Azimuth: %.1f" % nextPass["rise_az"]))
+        print(("Set Azimuth : %.1f" % nextPass["set_az"]))
+        print(("Max Altitude: %.1f" % nextPass["max_alt"]))
+        print(("Duration    : %s" % duration))
+        for segment in nextPass["visible"]:
+            print(("Visible     : %s to %s" % (orbit.localTime(segment["start"]).time(),
+                                                orbit.localTime(segment["end"]).time())))
+        if not nextPass["visible"]:
+            print("Visible     : no (daylight or ISS in shadow)")
+
+    # In VISIBLE_ONLY mode wake, alert and point only for the parts of
+    # passes you can see, so tr/ts become the next visible segment
+    seeNow = True
+    if config.VISIBLE_ONLY:
+        visiblePass, segment = orbit.nextVisible(passes, ct)
+        tr = ts = None
+        if segment is not None:
+            tr = segment["start"]
+            ts = segment["end"]
+            duration = int((ts - tr).total_seconds())
+            print(("Next Visible Local time: %s" % orbit.localTime(tr)))
+        seeNow = (tr is not None and tr <= ct < ts)
+
+    # FIND THE CURRENT LOCATION OF ISS
+    iss.compute(site)
+    alt = math.degrees(iss.alt)
+    az = math.degrees(iss.az)
+    altDeg = int(alt)
+    azDeg = int(az)
+    iss.compute(ct)
+    sublat = math.degrees(iss.sublat)
+    sublong = math.degrees(iss.sublong)
+    cache.setPosition(ct, alt, az, sublat, sublong)
+    if config.INFO:
+      print()
+      print("CURRENT LOCATION:")
+      print(("Latitude : %s" % iss.sublat))
+      print(("Longitude: %s" % iss.sublong))
+      print(("Azimuth  : %s" % azDeg))
+      print(("Altitude : %s" % altDeg))
+  
+    # IS ISS VISIBLE NOW
+    level = alertLevel(altDeg)
+    if ( level > 0 and seeNow ):
+      if config.INFO:
+        print("ISS IS OVERHEAD" if level > 1 else "ISS IS VISIBLE")
+
+      # Point first, then flash and play sounds once per level reached
+      now = clock.utcnow()
+      t0  = clock.time()
+      wait = orbit.nextCheck(iss, site, now)
+      resilience.setDeadline(t0 + wait)
+      outputs.notify(outs, 'track', iss, site)
+      if (level > alert):
+        outputs.notify(outs, 'alert', level, duration)
+        alert = level
+
+      # Next update when the ISS has moved far enough to need a move,
+      # less the time already spent on this one
+      next_check = wait - (clock.time() - t0)
+      next_check = max(config.MIN_CHECK, next_check)
+    else:
+      if config.INFO:
+          print("ISS below horizon" if level == 0 else "ISS up but cannot be seen")
+      alert = 0
+      outputs.notify(outs, 'idle', tr)
+      outputs.notify(outs, 'quiet', outputs.isQuiet())
+
+      # Sleep a minute, or less if the next pass starts sooner
+      # (only looking in on the TLE until then in VISIBLE_ONLY mode)
+      idle = config.TLE_CHECK if config.VISIBLE_ONLY else config.IDLE_CHECK
+      next_check = idle
+      if tr is not None:
+          next_check = min(idle, max(1, orbit.secondsUntil(tr)))
+
+    tracklog.record(ct.replace(tzinfo=datetime.timezone.utc).timestamp(), alt, az, sublat, sublong, level)
+
+    if first:
+      first = False
+      if config.DEBUG:
+        print("Startup to first update: %.2fs" % (clock.time() - start))
+
+    clock.sleep(next_check)
+  # END WHILE
+
+
+def main(argv=None, start=None):
+    parser = argparse.ArgumentParser(description="ISS flyover detection and AltAz pointer tracking")
+    parser.add_argument("--lcd", action="store_true", help="enable the Adafruit LCD display")
+    parser.add_argument("--audio", action="store_true", help="enable sound alerts")
+    parser.add_argument("--no-pointer", action="store_true", help="disable the ESP8266 pointer")
+    parser.add_argument("--api", action="store_true", help="serve passes and position as JSON")
+    parser.add_argument("--visible-only", action="store_true",
+                        help="only alert and point when the ISS can be seen by eye")
+    args = parser.parse_args(argv)
+
+    if args.lcd:
+        config.LCD = 1
+    if args.audio:
+        config.AUDIO = 1
+    if args.no_pointer:
+        config.POINTER = 0
+    if args.api:
+        config.API = 1
+    if args.visible_only:
+        config.VISIBLE_ONLY = 1
+
+    # Only the enabled outputs are imported and initialized
+    names = [name for name, on in (("pointer", config.POINTER),
+                                   ("lcd", config.LCD),
+                                   ("audio", config.AUDIO)) if on]
+    outs = outputs.load(names)
+    atexit.register(exit_handler, outs)
+    run(outs, start)
@@ -0,0 +1,118 @@
+# BINARY TRACK LOG
+# Every pass through the tracking loop appends one fixed-size record to a
+# memory-mapped ring buffer file, so the last TRACKLOG_RECORDS updates
+# survive restarts (unlike nohup.out) at almost no cost to the loop.
+#
+# Usage (reader):
+# python3 -m isstrack.tracklog track.bin              -- all records as CSV
+# python3 -m isstrack.tracklog track.bin --last 100   -- newest 100
+#
+
+import argparse
+import math
+import mmap
+import os
+import struct
+
+from . import config
+
+MAGIC = b"ISSTRAK1"
+HEADER = struct.Struct("<8sIIQ8x")      # magic, record size, capacity, count
+RECORD = struct.Struct("<dffffhhffI")
+FIELDS = ["time", "alt", "az", "sublat", "sublong", "steps", "angle",
+          "latency_az", "latency_alt", "level"]
+NAN = float('nan')
+
+glob_log = None         # open TrackLog, or None when logging is off
+glob_command = {}       # what the pointer commanded since the last record
+
+
+class TrackLog:
+
+    def __init__(self, path, capacity, write=True):
+        size = HEADER.size + capacity * RECORD.size
+        mode = "r+b" if os.path.exists(path) else "w+b"
+        if not write:
+            mode = "rb"
+        self.file = open(path, mode)
+        if write and os.fstat(self.file.fileno()).st_size != size:
+            self.file.truncate(size)
+        access = mmap.ACCESS_WRITE if write else mmap.ACCESS_READ
+        self.map = mmap.mmap(self.file.fileno(), 0, access=access)
+        magic, recsize, cap, count = HEADER.unpack_from(self.map, 0)
+        if (magic != MAGIC or recsize != RECORD.size or (write and cap != capacity)):
+            if not write:
+                raise ValueError("%s is not a track log" % path)
+            # New file, or one written with other settings: start over
+            cap, count = capacity, 0
+            HEADER.pack_into(self.map, 0, MAGIC, RECORD.size, cap, count)
+        self.capacity = cap
+        self.count = count
+
+    def append(self, *values):
+        offset = HEADER.size + (self.count % self.capacity) * RECORD.size
+        RECORD.pack_into(self.map, offset, *values)
+        self.count += 1
+        HEADER.pack_into(self.map, 0, MAGIC, RECORD.size, self.capacity, self.count)
+
+    # Records oldest to newest
+    def records(self, last=None):
+        n = min(self.count, self.capacity)
+        if last is not None:
+            n = min(n, last)
+        for i in range(self.count - n, self.count):
+            yield RECORD.unpack_from(self.map, HEADER.size + (i % self.capacity) * RECORD.size)
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+
+# OPEN THE LOG NAMED IN config.TRACKLOG
+def start():
+    global glob_log
+    if config.TRACKLOG:
+        try:
+            glob_log = TrackLog(config.TRACKLOG, config.TRACKLOG_RECORDS)
+        except Exception as ex:
+            print("ERROR: Cannot open track log, not logging")
+            print(ex)
+
+# NOTE WHAT THE POINTER WAS TOLD TO DO (steps, angle, latency_az, latency_alt)
+def command(**values):
+    glob_command.update(values)
+
+# APPEND ONE TRACKING UPDATE
+def record(when, alt, az, sublat, sublong, level):
+    if glob_log is None:
+        glob_command.clear()
+        return
+    glob_log.append(when, alt, az, sublat, sublong,
+                    glob_command.get("steps", 0), glob_command.get("angle", -1),
+                    glob_command.get("latency_az", NAN), glob_command.get("latency_alt", NAN),
+                    level)
+    glob_command.clear()
+
+def stop():
+    global glob_log
+    if glob_log is not None:
+        glob_log.close()
+        glob_log = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dump an ISSPointer track log as CSV")
+    parser.add_argument("path", nargs="?", default=config.TRACKLOG, help="track log file")
+    parser.add_argument("--last", type=int, help="only the newest N records")
+    args = parser.parse_args(argv)
+
+    log = TrackLog(args.path, 0, write=False)
+    print(",".join(FIELDS))
+    for rec in log.records(args.last):
+        print(",".join("" if (isinstance(v, float) and math.isnan(v)) else
+                       ("%.6f" % v if isinstance(v, float) else str(v)) for v in rec))
+    log.close()
+
+
+if __name__ == '__main__':
+    main()
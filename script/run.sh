@@ -2,5 +2,4 @@
 
 cd /home/pi
 sudo rm nohup.out
-sudo nohup python3 -u ./isspointer.py &
-
+sudo nohup python3 -u ./isspointer.py --lcd --audio &
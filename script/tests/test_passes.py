@@ -0,0 +1,87 @@
+import datetime
+import time
+
+import pytest
+
+from isstrack import cache
+from isstrack import clock
+from isstrack import config
+from isstrack import orbit
+
+TLE = ["ISS (ZARYA)",
+       "1 25544U 98067A   26292.06527778  .00002182  00000-0  40864-4 0  2928",
+       "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391 63532"]
+EPOCH = datetime.datetime(2026, 10, 19, 1, 34)
+SITE = (51.5, 0.0, 0.0)         # London sees some of these passes by eye
+
+
+def setNow(monkeypatch, when):
+    stamp = when.replace(tzinfo=datetime.timezone.utc).timestamp()
+    monkeypatch.setattr(clock, "glob_offset", stamp - time.time())
+
+
+@pytest.fixture(autouse=True)
+def fixedTLE(monkeypatch):
+    monkeypatch.setattr(orbit, "glob_tle", TLE)
+    monkeypatch.setattr(config, "LAT", SITE[0])
+    monkeypatch.setattr(config, "LON", SITE[1])
+    monkeypatch.setattr(config, "ELV", SITE[2])
+    monkeypatch.setattr(cache, "glob_passes", [])
+    monkeypatch.setattr(cache, "glob_passKey", None)
+    setNow(monkeypatch, EPOCH)
+
+
+@pytest.fixture(scope="module")
+def passes():
+    return orbit.nextPasses(orbit.ephem.readtle(*TLE), orbit.makeSite(*SITE, EPOCH), 12)
+
+
+def test_segments_match_sampling(passes):
+    iss = orbit.getISS()
+    site = orbit.getSite()
+    sun = orbit.ephem.Sun()
+    second = datetime.timedelta(seconds=1)
+    seen = 0
+    for p in passes:
+        segments = p["visible"]
+        for seg in segments:
+            assert p["rise"] <= seg["start"] < seg["end"] <= p["set"]
+        for a, b in zip(segments, segments[1:]):
+            assert a["end"] < b["start"]
+        # Every second of the pass away from the edges agrees
+        t = p["rise"]
+        while (t < p["set"]):
+            inside = any(seg["start"] + second < t < seg["end"] - second for seg in segments)
+            outside = all(not (seg["start"] - second <= t <= seg["end"] + second) for seg in segments)
+            if (inside or outside):
+                assert orbit.isVisible(iss, sun, site, t) == inside
+            t += datetime.timedelta(seconds=5)
+        seen += bool(segments)
+    # Some passes are seen and some are not
+    assert 0 < seen < len(passes)
+
+
+def test_next_visible_skips_unseen(passes):
+    p, seg = orbit.nextVisible(passes, EPOCH)
+    assert seg is not None
+    assert all(not q["visible"] for q in passes[:passes.index(p)])
+    assert orbit.nextVisible(passes, passes[-1]["set"]) == (None, None)
+
+
+def test_cache_keeps_pass_under_way(monkeypatch, passes):
+    p = passes[1]
+    now = p["rise"] + (p["set"] - p["rise"]) / 2
+    setNow(monkeypatch, now)
+    got = cache.passes()
+    assert got[0]["rise"] <= clock.utcnow() < got[0]["set"]
+    assert abs((got[0]["rise"] - p["rise"]).total_seconds()) < 1
+    assert len(got) == config.PASS_COUNT
+
+
+def test_cache_drops_ended_and_tops_up(monkeypatch, passes):
+    first = cache.passes()
+    setNow(monkeypatch, passes[0]["set"] + datetime.timedelta(seconds=30))
+    got = cache.passes()
+    assert all(q["set"] > clock.utcnow() for q in got)
+    assert abs((got[0]["rise"] - first[1]["rise"]).total_seconds()) < 1
+    assert len(got) == config.PASS_COUNT
@@ -0,0 +1,106 @@
+import pytest
+
+from isstrack import clock
+from isstrack import config
+from isstrack import resilience
+
+
+@pytest.fixture(autouse=True)
+def simulated(monkeypatch):
+    # Sleeps move the clock instead of waiting, every test starts clean
+    monkeypatch.setattr(clock, "glob_offset", 0.0)
+    monkeypatch.setattr(clock, "glob_onSleep", lambda: None)
+    monkeypatch.setattr(resilience, "glob_breakers", {})
+    monkeypatch.setattr(resilience, "glob_deadline", None)
+    monkeypatch.setattr(config, "DEBUG", 0)
+
+
+class Flaky:
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = []
+
+    def __call__(self, timeout):
+        self.calls.append(timeout)
+        if (len(self.calls) <= self.failures):
+            raise OSError("down")
+        return "ok"
+
+
+def test_backoff_capped():
+    for attempt in (0, 5, 16, 100, 10000):
+        delay = resilience.backoff(attempt)
+        assert 0 < delay <= config.BACKOFF_MAX
+    assert resilience.backoff(10000) >= config.BACKOFF_MAX * 0.5
+
+
+def test_retries_then_succeeds():
+    fn = Flaky(2)
+    assert resilience.call("test", fn, retries=3) == "ok"
+    assert len(fn.calls) == 3
+    assert resilience.breaker("test").failures == 0
+
+
+def test_out_of_retries_raises_last_error():
+    fn = Flaky(10)
+    with pytest.raises(OSError):
+        resilience.call("test", fn, retries=1)
+    assert len(fn.calls) == 2
+
+
+def test_breaker_open_half_open_close(monkeypatch):
+    monkeypatch.setattr(config, "BREAKER_FAILURES", 2)
+    fn = Flaky(2)
+    for i in range(2):
+        with pytest.raises(OSError):
+            resilience.call("test", fn, retries=0)
+    # Open: fails at once without calling
+    with pytest.raises(resilience.CircuitOpen):
+        resilience.call("test", fn, retries=0)
+    assert len(fn.calls) == 2
+    # Half open after the reset time: one trial call closes it again
+    clock.sleep(config.BREAKER_RESET)
+    assert resilience.call("test", fn, retries=0) == "ok"
+    assert resilience.breaker("test").openedAt is None
+
+
+def test_failed_trial_reopens(monkeypatch):
+    monkeypatch.setattr(config, "BREAKER_FAILURES", 1)
+    fn = Flaky(2)
+    with pytest.raises(OSError):
+        resilience.call("test", fn, retries=3)
+    clock.sleep(config.BREAKER_RESET)
+    with pytest.raises(OSError):
+        resilience.call("test", fn, retries=3)
+    with pytest.raises(resilience.CircuitOpen):
+        resilience.call("test", fn, retries=3)
+    assert len(fn.calls) == 2
+
+
+def test_attempt_timeout_cut_by_deadline():
+    fn = Flaky(0)
+    resilience.setDeadline(clock.time() + 2.0)
+    resilience.call("test", fn, timeout=10)
+    assert fn.calls[0] <= 2.0
+
+
+def test_no_time_left_fails_fast():
+    fn = Flaky(0)
+    resilience.setDeadline(clock.time() - 1.0)
+    with pytest.raises(resilience.DeadlinePassed):
+        resilience.call("test", fn)
+    assert fn.calls == []
+    # Calls that cannot be given up part way still get their timeout
+    assert resilience.call("test", fn, timeout=7, deadline=False) == "ok"
+    assert fn.calls == [7]
+
+
+def test_no_retry_sleep_past_deadline():
+    fn = Flaky(10)
+    resilience.setDeadline(clock.time() + 0.1)
+    start = clock.time()
+    with pytest.raises(OSError):
+        resilience.call("test", fn, retries=5)
+    assert len(fn.calls) == 1
+    assert clock.time() - start < 0.1
@@ -0,0 +1,65 @@
+from isstrack import tracklog
+
+
+def append(log, n, start=0):
+    for i in range(start, start + n):
+        log.append(float(i), 1.0, 2.0, 3.0, 4.0, i, 0, 0.5, 0.25, 1)
+
+
+def times(log, last=None):
+    return [rec[0] for rec in log.records(last)]
+
+
+def test_records_before_wrap(tmp_path):
+    log = tracklog.TrackLog(str(tmp_path / "track.bin"), 5)
+    append(log, 3)
+    assert times(log) == [0.0, 1.0, 2.0]
+    log.close()
+
+
+def test_wrap_keeps_newest_oldest_first(tmp_path):
+    log = tracklog.TrackLog(str(tmp_path / "track.bin"), 5)
+    append(log, 12)
+    assert times(log) == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert times(log, last=2) == [10.0, 11.0]
+    assert times(log, last=50) == [7.0, 8.0, 9.0, 10.0, 11.0]
+    log.close()
+
+
+def test_reopen_continues(tmp_path):
+    path = str(tmp_path / "track.bin")
+    log = tracklog.TrackLog(path, 4)
+    append(log, 6)
+    log.close()
+    log = tracklog.TrackLog(path, 4)
+    append(log, 1, start=6)
+    assert times(log) == [3.0, 4.0, 5.0, 6.0]
+    log.close()
+    reader = tracklog.TrackLog(path, 0, write=False)
+    assert times(reader, last=1) == [6.0]
+    reader.close()
+
+
+def test_capacity_change_starts_over(tmp_path):
+    path = str(tmp_path / "track.bin")
+    log = tracklog.TrackLog(path, 4)
+    append(log, 3)
+    log.close()
+    log = tracklog.TrackLog(path, 8)
+    assert log.count == 0
+    assert times(log) == []
+    append(log, 2, start=10)
+    assert times(log) == [10.0, 11.0]
+    log.close()
+
+
+def test_record_takes_pointer_command(tmp_path, monkeypatch):
+    log = tracklog.TrackLog(str(tmp_path / "track.bin"), 4)
+    monkeypatch.setattr(tracklog, "glob_log", log)
+    tracklog.command(steps=3, angle=45)
+    tracklog.record(1.0, 10.0, 20.0, 30.0, 40.0, 2)
+    tracklog.record(2.0, 10.0, 20.0, 30.0, 40.0, 2)
+    first, second = log.records()
+    assert first[5:7] == (3, 45)
+    assert second[5:7] == (0, -1)
+    log.close()